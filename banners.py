@@ -0,0 +1,160 @@
+"""
+Instruction boxes printed by `run.py phase`, and the outputs each box lists.
+
+Kept separate from run.py so the CLI logic stays readable.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Annotations are only for type checkers; avoid importing typing at startup
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Final
+
+PHASE_RESEARCH: Final[str] = """
++----------------------------------------------------------------------+
+|  PHASE 1: RESEARCH                                                   |
++----------------------------------------------------------------------+
+|  Skill: skills/research/SKILL.md                                     |
+|                                                                      |
+|  Tasks:                                                              |
+|  1. Search literature for each construct in the theme                |
+|  2. Gather instrument specifications                                 |
+|  3. Build bibliography (25-40 recent sources)                        |
+|  4. Document expected relationships between constructs               |
+|                                                                      |
+|  Outputs:                                                            |
+|  - outputs/research/literature_review.md                             |
+|  - outputs/research/constructs.json                                  |
+|  - outputs/research/instruments_detailed.json                        |
+|  - outputs/research/bibliography.json                                |
++----------------------------------------------------------------------+
+"""
+
+PHASE_FEASIBILITY_RESEARCH: Final[str] = """
++----------------------------------------------------------------------+
+|  PHASE 2: FEASIBILITY - RESEARCH DIRECTION                           |
++----------------------------------------------------------------------+
+|  Skill: skills/feasibility-research/SKILL.md                         |
+|                                                                      |
+|  CHECKPOINT: Discover the most scientifically relevant direction.    |
+|                                                                      |
+|  Tasks:                                                              |
+|  1. Map established vs. novel findings                               |
+|  2. Identify gaps and opportunities                                  |
+|  3. Evaluate hypothesis options (novelty, feasibility, interest)     |
+|  4. Recommend optimal research direction                             |
+|                                                                      |
+|  Outputs:                                                            |
+|  - outputs/feasibility/research_landscape.json                       |
+|  - outputs/feasibility/direction_recommendation.md                   |
+|  - outputs/feasibility/feasibility_matrix.md                         |
+|                                                                      |
+|  >> Review direction_recommendation.md before proceeding! <<         |
++----------------------------------------------------------------------+
+"""
+
+PHASE_SIMULATE: Final[str] = """
++----------------------------------------------------------------------+
+|  PHASE 3: DATA SIMULATION                                            |
++----------------------------------------------------------------------+
+|  Skill: skills/data-simulator/SKILL.md                               |
+|                                                                      |
+|  Tasks:                                                              |
+|  1. Load instrument specs and refined hypotheses                     |
+|  2. Generate demographics (Romanian sample by default)               |
+|  3. Simulate responses with embedded correlations                    |
+|  4. Compute subscale scores                                          |
+|                                                                      |
+|  Outputs:                                                            |
+|  - outputs/data/demographics.csv                                     |
+|  - outputs/data/responses_raw.csv                                    |
+|  - outputs/data/responses_coded.xlsx                                 |
+|  - outputs/data/simulation_parameters.json                           |
++----------------------------------------------------------------------+
+"""
+
+PHASE_FEASIBILITY_DATA: Final[str] = """
++----------------------------------------------------------------------+
+|  PHASE 4: FEASIBILITY - DATA VALIDATION                              |
++----------------------------------------------------------------------+
+|  Skill: skills/feasibility-data/SKILL.md                             |
+|                                                                      |
+|  CHECKPOINT: Validate data quality before full analysis.             |
+|                                                                      |
+|  Tasks:                                                              |
+|  1. Check if target correlations were achieved                       |
+|  2. Verify scale reliability (alpha >= 0.70)                         |
+|  3. Assess statistical power for planned tests                       |
+|  4. Flag distribution problems                                       |
+|                                                                      |
+|  Outputs:                                                            |
+|  - outputs/feasibility/data_quality.json                             |
+|  - outputs/feasibility/data_feasibility_report.md                    |
+|                                                                      |
+|  Decision:                                                           |
+|  - PROCEED: All checks pass                                          |
+|  - CAUTION: Minor issues, note limitations                           |
+|  - REGENERATE: Critical issues, return to Phase 3                    |
++----------------------------------------------------------------------+
+"""
+
+PHASE_ANALYZE: Final[str] = """
++----------------------------------------------------------------------+
+|  PHASE 5: DATA ANALYSIS                                              |
++----------------------------------------------------------------------+
+|  Skill: skills/data-analysis/SKILL.md                                |
+|                                                                      |
+|  Tasks:                                                              |
+|  1. Compute descriptive statistics                                   |
+|  2. Test hypotheses (correlations, t-tests, ANOVA)                   |
+|  3. Calculate reliability (Cronbach's alpha)                         |
+|  4. Generate visualizations                                          |
+|                                                                      |
+|  Outputs:                                                            |
+|  - outputs/analysis/descriptive_stats.json                           |
+|  - outputs/analysis/hypothesis_tests.json                            |
+|  - outputs/analysis/reliability.json                                 |
+|  - outputs/analysis/figures/*.png                                    |
+|  - outputs/analysis/tables/*.md                                      |
++----------------------------------------------------------------------+
+"""
+
+PHASE_WRITE: Final[str] = """
++----------------------------------------------------------------------+
+|  PHASE 6: THESIS WRITING                                             |
++----------------------------------------------------------------------+
+|  Skill: skills/thesis-writer/SKILL.md                                |
+|                                                                      |
+|  Tasks:                                                              |
+|  1. Compose Introduction                                             |
+|  2. Write Chapter 1 (Theory) from literature_review.md               |
+|  3. Write Chapter 2 (Methods) from instruments_detailed.json         |
+|  4. Write Chapter 3 (Results) from analysis outputs                  |
+|  5. Write Chapter 4 (Conclusions)                                    |
+|  6. Generate Abstract                                                |
+|  7. Assemble final document                                          |
+|                                                                      |
+|  Outputs:                                                            |
+|  - outputs/thesis/chapters/*.md                                      |
+|  - outputs/thesis/thesis_draft.docx                                  |
++----------------------------------------------------------------------+
+"""
+
+PHASE_INSTRUCTIONS: Final[dict] = {
+    "research": PHASE_RESEARCH,
+    "feasibility-research": PHASE_FEASIBILITY_RESEARCH,
+    "simulate": PHASE_SIMULATE,
+    "feasibility-data": PHASE_FEASIBILITY_DATA,
+    "analyze": PHASE_ANALYZE,
+    "write": PHASE_WRITE,
+}
+
+# Output files/globs (relative to the repo root), read from each box's Outputs list
+_OUTPUT_LINE_RE = re.compile(r"^\|  - (outputs/\S+)", re.MULTILINE)
+
+PHASE_OUTPUTS: Final[dict] = {
+    phase: tuple(_OUTPUT_LINE_RE.findall(box)) for phase, box in PHASE_INSTRUCTIONS.items()
+}
@@ -6,27 +6,39 @@ Entry point for the thesis generation workflow.
 See CLAUDE.md for full documentation.
 
 Usage:
-    # Full pipeline with arguments
-    python run.py --theme "Construct A and Construct B" --instruments "SCALE1,SCALE2" --sample 50
+    # Initialize the pipeline
+    python run.py init --theme "Construct A and Construct B" --instruments "SCALE1,SCALE2" --sample 50
 
     # Individual phases (6-phase workflow with feasibility checkpoints)
-    python run.py --phase research
-    python run.py --phase feasibility-research
-    python run.py --phase simulate
-    python run.py --phase feasibility-data
-    python run.py --phase analyze
-    python run.py --phase write
+    python run.py phase research
+    python run.py phase feasibility-research
+    python run.py phase simulate
+    python run.py phase feasibility-data
+    python run.py phase analyze
+    python run.py phase write
+
+    # Checkpointing: record finished phases, then pick up where you left off
+    python run.py complete research
+    python run.py resume
+
+    # Inspect the configuration
+    python run.py status
 
 Examples:
-    python run.py --theme "Emotional Intelligence and Job Performance" --instruments "EQ-i,JPI" --sample 100
-    python run.py --full  # Uses existing inputs/config.json
+    python run.py init --theme "Emotional Intelligence and Job Performance" --instruments "EQ-i,JPI" --sample 100
+    python run.py full  # Uses existing inputs/config.json
 """
 
-import argparse
-import json
+import copy
+import functools
+import os
+import re
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType
+
+from banners import PHASE_INSTRUCTIONS, PHASE_OUTPUTS
 
 # Configuration
 REPO_ROOT = Path(__file__).parent
@@ -34,17 +46,67 @@ SKILLS_DIR = REPO_ROOT / "skills"
 INPUTS_DIR = REPO_ROOT / "inputs"
 OUTPUTS_DIR = REPO_ROOT / "outputs"
 
+OUTPUT_SUBDIRS = tuple(OUTPUTS_DIR / subdir for subdir in ["research", "feasibility", "data", "analysis", "thesis/chapters"])
+
 PHASES = ["research", "feasibility-research", "simulate", "feasibility-data", "analyze", "write"]
 
+# Shared read-only fallback for phases missing from config
+_UNKNOWN_STATUS = MappingProxyType({"status": "unknown"})
+
+@functools.cache
+def _json_backend():
+    """Return orjson if installed, otherwise the stdlib json module."""
+    try:
+        import orjson
+        return orjson
+    except ImportError:  # Optional: fall back to stdlib json
+        import json
+        return json
+
+def dumps_json(data: dict) -> bytes:
+    """Encode data as indented JSON bytes."""
+    backend = _json_backend()
+    if backend.__name__ == "orjson":
+        return backend.dumps(data, option=backend.OPT_INDENT_2)
+    return backend.dumps(data, indent=2).encode("utf-8")
+
+def loads_json(data: bytes) -> dict:
+    """Decode JSON bytes."""
+    return _json_backend().loads(data)
+
+def read_json(path: Path) -> dict:
+    """Read and decode a JSON file."""
+    return loads_json(path.read_bytes())
+
+# Parsed configs keyed by path -> (mtime_ns, size, config)
+_CONFIG_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+_DIRS_READY = False
+
 def setup_directories():
     """Create output directories if they don't exist."""
-    for subdir in ["research", "feasibility", "data", "analysis", "thesis/chapters"]:
-        (OUTPUTS_DIR / subdir).mkdir(parents=True, exist_ok=True)
-    INPUTS_DIR.mkdir(exist_ok=True)
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for path in OUTPUT_SUBDIRS:
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+    if not INPUTS_DIR.is_dir():
+        INPUTS_DIR.mkdir(exist_ok=True)
+    _DIRS_READY = True
+
+def _fmt_ts(ts) -> str:
+    """Format an epoch timestamp for display (older configs store ISO strings)."""
+    if isinstance(ts, (int, float)):
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+    return str(ts)
+
+_INSTRUMENTS_RE = re.compile(r"\s*,\s*")
 
 def parse_instruments(instruments_str: str) -> list:
     """Parse comma-separated instrument names."""
-    return [i.strip() for i in instruments_str.split(",")]
+    instruments_str = instruments_str.strip()
+    return _INSTRUMENTS_RE.split(instruments_str) if instruments_str else []
 
 def create_config(theme: str, instruments: list, sample_size: int) -> dict:
     """Create configuration for the pipeline."""
@@ -52,164 +114,102 @@ def create_config(theme: str, instruments: list, sample_size: int) -> dict:
         "theme": theme,
         "instruments": instruments,
         "sample_size": sample_size,
-        "created": datetime.now().isoformat(),
+        "created": time.time(),
         "phases": {phase: {"status": "pending"} for phase in PHASES}
     }
 
-def save_config(config: dict):
-    """Save configuration to inputs directory."""
-    config_path = INPUTS_DIR / "config.json"
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+def save_config(config: dict, config_path: Path | None = None):
+    """Save configuration to inputs directory, or to config_path if given."""
+    if config_path is None:
+        config_path = INPUTS_DIR / "config.json"
+    # Write a sibling file and rename so an interrupted save never truncates config.json
+    tmp_path = config_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(dumps_json(config))
+    os.replace(tmp_path, config_path)
+    _CONFIG_CACHE.pop(config_path, None)
     print(f"Configuration saved to {config_path}")
 
 def load_config() -> dict:
     """Load existing configuration."""
     config_path = INPUTS_DIR / "config.json"
-    if not config_path.exists():
-        raise FileNotFoundError(f"No configuration found at {config_path}. Run with --theme and --instruments first.")
-    with open(config_path) as f:
-        return json.load(f)
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No configuration found at {config_path}. Run init first.") from None
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(cached[2])
+    config = read_json(config_path)
+    _CONFIG_CACHE[config_path] = (st.st_mtime_ns, st.st_size, config)
+    return copy.deepcopy(config)
+
+def get_phase_status(config: dict, phase: str) -> str:
+    """Return the recorded status of a phase."""
+    phases = config.get('phases') or {}
+    return phases.get(phase, _UNKNOWN_STATUS).get('status', 'unknown')
+
+def mark_phase_completed(config: dict, phase: str):
+    """Record a phase as completed with a timestamp."""
+    config.setdefault('phases', {})[phase] = {"status": "completed", "completed_at": time.time()}
+
+def _output_mtimes(phase: str):
+    """Return mtimes of all outputs of a phase, or None if any listed output is missing."""
+    mtimes = []
+    for pattern in PHASE_OUTPUTS.get(phase, ()):
+        matches = list(REPO_ROOT.glob(pattern))
+        if not matches:
+            return None
+        mtimes.extend(p.stat().st_mtime_ns for p in matches)
+    return mtimes or None
+
+def _created_ns(config: dict) -> int:
+    """Return when the config's inputs were set by init, in nanoseconds (0 if unknown)."""
+    created = config.get('created')
+    if isinstance(created, (int, float)):
+        return int(created * 1_000_000_000)
+    if isinstance(created, str):  # Older configs store ISO strings
+        from datetime import datetime
+        try:
+            return int(datetime.fromisoformat(created).timestamp() * 1_000_000_000)
+        except ValueError:
+            pass
+    return 0
+
+def phase_outputs_fresh(phase: str, config: dict) -> bool:
+    """Check whether a phase's outputs exist and are newer than the config's inputs and all earlier phases' outputs."""
+    mtimes = _output_mtimes(phase)
+    if mtimes is None:
+        return False
+    # Use the init timestamp rather than the file mtime: complete rewrites config.json without changing inputs
+    newest_input = _created_ns(config)
+    for upstream_phase in PHASES[:PHASES.index(phase)]:
+        upstream = _output_mtimes(upstream_phase)
+        if upstream is None:
+            return False
+        newest_input = max(newest_input, max(upstream))
+    return newest_input <= min(mtimes)
+
+def next_phase_to_run(config: dict):
+    """Return the first phase that is neither completed nor up to date, or None if all are done."""
+    for phase in PHASES:
+        if get_phase_status(config, phase) != "completed" and not phase_outputs_fresh(phase, config):
+            return phase
+    return None
 
 def print_phase_instructions(phase: str):
     """Print instructions for executing a phase."""
-    instructions = {
-        "research": """
-+----------------------------------------------------------------------+
-|  PHASE 1: RESEARCH                                                   |
-+----------------------------------------------------------------------+
-|  Skill: skills/research/SKILL.md                                     |
-|                                                                      |
-|  Tasks:                                                              |
-|  1. Search literature for each construct in the theme                |
-|  2. Gather instrument specifications                                 |
-|  3. Build bibliography (25-40 recent sources)                        |
-|  4. Document expected relationships between constructs               |
-|                                                                      |
-|  Outputs:                                                            |
-|  - outputs/research/literature_review.md                             |
-|  - outputs/research/constructs.json                                  |
-|  - outputs/research/instruments_detailed.json                        |
-|  - outputs/research/bibliography.json                                |
-+----------------------------------------------------------------------+
-""",
-        "feasibility-research": """
-+----------------------------------------------------------------------+
-|  PHASE 2: FEASIBILITY - RESEARCH DIRECTION                           |
-+----------------------------------------------------------------------+
-|  Skill: skills/feasibility-research/SKILL.md                         |
-|                                                                      |
-|  CHECKPOINT: Discover the most scientifically relevant direction.    |
-|                                                                      |
-|  Tasks:                                                              |
-|  1. Map established vs. novel findings                               |
-|  2. Identify gaps and opportunities                                  |
-|  3. Evaluate hypothesis options (novelty, feasibility, interest)     |
-|  4. Recommend optimal research direction                             |
-|                                                                      |
-|  Outputs:                                                            |
-|  - outputs/feasibility/research_landscape.json                       |
-|  - outputs/feasibility/direction_recommendation.md                   |
-|  - outputs/feasibility/feasibility_matrix.md                         |
-|                                                                      |
-|  >> Review direction_recommendation.md before proceeding! <<         |
-+----------------------------------------------------------------------+
-""",
-        "simulate": """
-+----------------------------------------------------------------------+
-|  PHASE 3: DATA SIMULATION                                            |
-+----------------------------------------------------------------------+
-|  Skill: skills/data-simulator/SKILL.md                               |
-|                                                                      |
-|  Tasks:                                                              |
-|  1. Load instrument specs and refined hypotheses                     |
-|  2. Generate demographics (Romanian sample by default)               |
-|  3. Simulate responses with embedded correlations                    |
-|  4. Compute subscale scores                                          |
-|                                                                      |
-|  Outputs:                                                            |
-|  - outputs/data/demographics.csv                                     |
-|  - outputs/data/responses_raw.csv                                    |
-|  - outputs/data/responses_coded.xlsx                                 |
-|  - outputs/data/simulation_parameters.json                           |
-+----------------------------------------------------------------------+
-""",
-        "feasibility-data": """
-+----------------------------------------------------------------------+
-|  PHASE 4: FEASIBILITY - DATA VALIDATION                              |
-+----------------------------------------------------------------------+
-|  Skill: skills/feasibility-data/SKILL.md                             |
-|                                                                      |
-|  CHECKPOINT: Validate data quality before full analysis.             |
-|                                                                      |
-|  Tasks:                                                              |
-|  1. Check if target correlations were achieved                       |
-|  2. Verify scale reliability (alpha >= 0.70)                         |
-|  3. Assess statistical power for planned tests                       |
-|  4. Flag distribution problems                                       |
-|                                                                      |
-|  Outputs:                                                            |
-|  - outputs/feasibility/data_quality.json                             |
-|  - outputs/feasibility/data_feasibility_report.md                    |
-|                                                                      |
-|  Decision:                                                           |
-|  - PROCEED: All checks pass                                          |
-|  - CAUTION: Minor issues, note limitations                           |
-|  - REGENERATE: Critical issues, return to Phase 3                    |
-+----------------------------------------------------------------------+
-""",
-        "analyze": """
-+----------------------------------------------------------------------+
-|  PHASE 5: DATA ANALYSIS                                              |
-+----------------------------------------------------------------------+
-|  Skill: skills/data-analysis/SKILL.md                                |
-|                                                                      |
-|  Tasks:                                                              |
-|  1. Compute descriptive statistics                                   |
-|  2. Test hypotheses (correlations, t-tests, ANOVA)                   |
-|  3. Calculate reliability (Cronbach's alpha)                         |
-|  4. Generate visualizations                                          |
-|                                                                      |
-|  Outputs:                                                            |
-|  - outputs/analysis/descriptive_stats.json                           |
-|  - outputs/analysis/hypothesis_tests.json                            |
-|  - outputs/analysis/reliability.json                                 |
-|  - outputs/analysis/figures/*.png                                    |
-|  - outputs/analysis/tables/*.md                                      |
-+----------------------------------------------------------------------+
-""",
-        "write": """
-+----------------------------------------------------------------------+
-|  PHASE 6: THESIS WRITING                                             |
-+----------------------------------------------------------------------+
-|  Skill: skills/thesis-writer/SKILL.md                                |
-|                                                                      |
-|  Tasks:                                                              |
-|  1. Compose Introduction                                             |
-|  2. Write Chapter 1 (Theory) from literature_review.md               |
-|  3. Write Chapter 2 (Methods) from instruments_detailed.json         |
-|  4. Write Chapter 3 (Results) from analysis outputs                  |
-|  5. Write Chapter 4 (Conclusions)                                    |
-|  6. Generate Abstract                                                |
-|  7. Assemble final document                                          |
-|                                                                      |
-|  Outputs:                                                            |
-|  - outputs/thesis/chapters/*.md                                      |
-|  - outputs/thesis/thesis_draft.docx                                  |
-+----------------------------------------------------------------------+
-"""
-    }
-    print(instructions.get(phase, f"Unknown phase: {phase}"))
+    print(PHASE_INSTRUCTIONS.get(phase, f"Unknown phase: {phase}"))
 
-def print_full_workflow(config: dict):
-    """Print the full workflow overview."""
-    print(f"""
+@functools.lru_cache(maxsize=1)
+def _render_workflow_banner(theme: str, instruments: tuple, sample_size: int) -> str:
+    """Render the workflow overview box."""
+    return f"""
 +======================================================================+
 |  THESIS DRAFT GENERATOR                                              |
 +======================================================================+
-|  Theme: {config['theme'][:56]:<56} |
-|  Instruments: {', '.join(config['instruments']):<52} |
-|  Sample Size: {config['sample_size']:<53} |
+|  Theme: {theme[:56]:<56} |
+|  Instruments: {', '.join(instruments):<52} |
+|  Sample Size: {sample_size:<53} |
 +----------------------------------------------------------------------+
 |  WORKFLOW (6 phases with 2 feasibility checkpoints):                 |
 |                                                                      |
@@ -222,75 +222,156 @@ def print_full_workflow(config: dict):
 |                                                                      |
 |  Execute phases sequentially. Review checkpoints before proceeding.  |
 +======================================================================+
-""")
+"""
+
+def print_full_workflow(config: dict):
+    """Print the full workflow overview."""
+    print(_render_workflow_banner(config['theme'], tuple(config['instruments']), config['sample_size']))
+
+def _load_config_or_exit(args, required: bool = True):
+    """Load the --config file or inputs/config.json.
+
+    A missing config exits with an error, or returns None when not required.
+    The init hint is only shown for inputs/config.json, the one file init writes.
+    """
+    try:
+        if args.config:
+            return read_json(Path(args.config))
+        return load_config()
+    except FileNotFoundError as e:
+        if not required:
+            if args.config:
+                print(f"No configuration found at {args.config}.")
+            else:
+                print("No configuration found. Initialize with: python run.py init --theme THEME --instruments SCALES")
+            return None
+        if args.config:
+            print(f"Error: No configuration found at {args.config}.")
+        else:
+            print(f"Error: {e}")
+            print("\nRun init to create a configuration:")
+            print('  python run.py init --theme "Your Theme" --instruments "SCALE1,SCALE2"')
+        sys.exit(1)
+
+def _config_path(args) -> Path:
+    """Return the config file a command reads from and writes back to."""
+    return Path(args.config) if args.config else INPUTS_DIR / "config.json"
+
+def print_phase_commands():
+    """Print the command for each phase."""
+    lines = ["\nTo execute a phase, run:"]
+    lines.extend(f"  python run.py phase {phase}" for phase in PHASES)
+    print("\n".join(lines))
+
+def cmd_init(args):
+    """Create and save a new configuration."""
+    setup_directories()
+    instruments = parse_instruments(args.instruments)
+    config = create_config(args.theme, instruments, args.sample)
+    save_config(config)
+    print_full_workflow(config)
+    print_phase_commands()
+
+def cmd_status(args):
+    """Show the current configuration and phase status."""
+    config = _load_config_or_exit(args, required=False)
+    if config is None:
+        return
+    lines = [
+        "\nCurrent configuration:",
+        f"  Theme: {config['theme']}",
+        f"  Instruments: {', '.join(config['instruments'])}",
+        f"  Sample: {config['sample_size']}",
+        "\nPhase status:",
+    ]
+    phases = config.get('phases') or {}
+    for phase in PHASES:
+        status = get_phase_status(config, phase)
+        marker = "  " if status == "pending" else "* "
+        completed_at = phases.get(phase, _UNKNOWN_STATUS).get('completed_at')
+        completed_at = f" ({_fmt_ts(completed_at)})" if completed_at is not None else ""
+        lines.append(f"  {marker}{phase}: {status}{completed_at}")
+    print("\n".join(lines))
+
+def cmd_phase(args):
+    """Print instructions for a phase unless it is already done."""
+    config = _load_config_or_exit(args)
+    setup_directories()
+    if get_phase_status(config, args.name) == "completed" and not args.force:
+        print(f"Skipping {args.name}: already completed. Pass --force to redo.")
+        return
+    if not args.force and phase_outputs_fresh(args.name, config):
+        print(f"Skipping {args.name}: outputs are up to date. Pass --force to redo.")
+        return
+    print_phase_instructions(args.name)
+
+def cmd_resume(args):
+    """Print instructions for the first phase that still needs running."""
+    config = _load_config_or_exit(args)
+    setup_directories()
+    phase = next_phase_to_run(config)
+    if phase is None:
+        print("All phases completed or up to date.")
+    else:
+        print_phase_instructions(phase)
+
+def cmd_complete(args):
+    """Mark a phase as completed."""
+    config = _load_config_or_exit(args)
+    mark_phase_completed(config, args.name)
+    save_config(config, _config_path(args))
+    print(f"Marked {args.name} as completed")
+
+def cmd_full(args):
+    """Show the full workflow overview."""
+    config = _load_config_or_exit(args)
+    print_full_workflow(config)
+    print_phase_commands()
 
 def main():
+    # Deferred so importing run.py stays cheap
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Thesis Draft Generator for Social Sciences",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
+    sub = parser.add_subparsers(dest="cmd", metavar="COMMAND")
 
-    # Configuration arguments
-    parser.add_argument("--theme", help="Research theme (e.g., 'Emotional Intelligence and Burnout')")
-    parser.add_argument("--instruments", help="Comma-separated instrument names (e.g., 'EQ-i,MBI')")
-    parser.add_argument("--sample", type=int, default=50, help="Sample size (default: 50)")
+    # Shared by every command that reads an existing configuration
+    config_parent = argparse.ArgumentParser(add_help=False)
+    config_parent.add_argument("--config", help="Path to custom config file")
 
-    # Phase selection
-    parser.add_argument("--phase", choices=PHASES, help="Run specific phase")
-    parser.add_argument("--full", action="store_true", help="Show full workflow")
+    init = sub.add_parser("init", help="Create a new configuration")
+    init.add_argument("--theme", required=True, help="Research theme (e.g., 'Emotional Intelligence and Burnout')")
+    init.add_argument("--instruments", required=True, help="Comma-separated instrument names (e.g., 'EQ-i,MBI')")
+    init.add_argument("--sample", type=int, default=50, help="Sample size (default: 50)")
+    init.set_defaults(func=cmd_init)
 
-    # Utility options
-    parser.add_argument("--status", action="store_true", help="Show current status")
-    parser.add_argument("--config", help="Path to custom config file")
+    status = sub.add_parser("status", parents=[config_parent], help="Show current status")
+    status.set_defaults(func=cmd_status)
 
-    args = parser.parse_args()
+    phase = sub.add_parser("phase", parents=[config_parent], help="Show instructions for a phase")
+    phase.add_argument("name", choices=PHASES, help="Phase to run")
+    phase.add_argument("--force", action="store_true", help="Show instructions even if already completed or outputs are up to date")
+    phase.set_defaults(func=cmd_phase)
 
-    # Setup directories
-    setup_directories()
+    resume = sub.add_parser("resume", parents=[config_parent], help="Show instructions for the first phase not yet completed or up to date")
+    resume.set_defaults(func=cmd_resume)
 
-    # Handle configuration
-    if args.theme and args.instruments:
-        instruments = parse_instruments(args.instruments)
-        config = create_config(args.theme, instruments, args.sample)
-        save_config(config)
-    elif args.config:
-        with open(args.config) as f:
-            config = json.load(f)
-    else:
-        try:
-            config = load_config()
-        except FileNotFoundError as e:
-            if not args.status:
-                print(f"Error: {e}")
-                print("\nRun with --theme and --instruments to initialize:")
-                print('  python run.py --theme "Your Theme" --instruments "SCALE1,SCALE2"')
-                sys.exit(1)
-            config = None
-
-    # Execute requested action
-    if args.status:
-        if config:
-            print(f"\nCurrent configuration:")
-            print(f"  Theme: {config['theme']}")
-            print(f"  Instruments: {', '.join(config['instruments'])}")
-            print(f"  Sample: {config['sample_size']}")
-            print(f"\nPhase status:")
-            for phase in PHASES:
-                status = config.get('phases', {}).get(phase, {}).get('status', 'unknown')
-                marker = "  " if status == "pending" else "* "
-                print(f"  {marker}{phase}: {status}")
-        else:
-            print("No configuration found. Initialize with --theme and --instruments.")
-    elif args.phase:
-        print_phase_instructions(args.phase)
-    elif args.full or config:
-        print_full_workflow(config)
-        print("\nTo execute a phase, run:")
-        for phase in PHASES:
-            print(f"  python run.py --phase {phase}")
-    else:
+    complete = sub.add_parser("complete", parents=[config_parent], help="Mark a phase as completed")
+    complete.add_argument("name", choices=PHASES, help="Phase to mark")
+    complete.set_defaults(func=cmd_complete)
+
+    full = sub.add_parser("full", parents=[config_parent], help="Show full workflow")
+    full.set_defaults(func=cmd_full)
+
+    args = parser.parse_args()
+    if args.cmd is None:
         parser.print_help()
+        return
+    args.func(args)
 
 if __name__ == "__main__":
     main()